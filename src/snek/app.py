@@ -1,9 +1,13 @@
 """Main Textual application for the Snek game."""
 
+from collections.abc import Callable
+from typing import ClassVar
+
 from textual.app import App
+from textual.screen import Screen
 
 from .config import GameConfig, default_config
-from .screens import SplashScreen
+from .screens import GameOverModal, PauseModal, SplashScreen
 from .themes import THEME_MAP
 
 
@@ -12,6 +16,13 @@ class SnakeApp(App):
 
     CSS_PATH = "styles.css"
 
+    # Installed screens are composed once and reused, so the figlet titles of
+    # these frequently shown modals are only rendered on first use
+    SCREENS: ClassVar[dict[str, Callable[[], Screen]]] = {
+        "pause": PauseModal,
+        "game-over": GameOverModal,
+    }
+
     def __init__(self, config: GameConfig = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.config = config or default_config
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameConfig:
     """Configuration settings for the Snake game."""
 
@@ -24,6 +24,8 @@ class GameConfig:
     min_game_height: int = 10
     snake_block: str = "██"
     empty_cell: str = "  "
+    # Seconds without a resize event before the grid is resized again
+    resize_settle_delay: float = 0.05
 
 
 default_config = GameConfig()
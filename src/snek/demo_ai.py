@@ -49,7 +49,7 @@ class DemoAI:
             return False
 
         # Check if any part of the path intersects with snake body (excluding the head)
-        snake_set = set(self.game.snake[1:])
+        snake_set = self.game.snake_cells - {self.game.snake[0]}
         for pos in self.path[1:]:  # Skip current head position
             if pos in snake_set:
                 return False
@@ -79,7 +79,9 @@ class DemoAI:
         """Use BFS to find shortest path, optionally avoiding snake body."""
         queue = deque([(start, [start])])
         visited = {start}
-        snake_set = set(self.game.snake[1:]) if avoid_body else set()
+        snake_set = (
+            self.game.snake_cells - {self.game.snake[0]} if avoid_body else set()
+        )
 
         while queue:
             current, path = queue.popleft()
@@ -105,7 +107,7 @@ class DemoAI:
     ) -> bool:
         """Check if a move is safe considering future snake positions."""
         # Basic safety: don't hit the snake body immediately
-        if next_pos in self.game.snake:
+        if next_pos in self.game.snake_cells:
             return False
         # Advanced safety: consider if the tail will move
         # If we haven't eaten recently, the tail will move away
@@ -131,7 +133,7 @@ class DemoAI:
                     current, direction, self.game.width, self.game.height
                 )
 
-                if next_pos not in self.game.snake and GameRules.is_valid_turn(
+                if next_pos not in self.game.snake_cells and GameRules.is_valid_turn(
                     self._pos_to_direction(current, next_pos), direction
                 ):
                     distance = self._manhattan_distance(next_pos, goal)
@@ -152,7 +154,7 @@ class DemoAI:
     def _avoid_collision(self) -> Optional[Direction]:
         """Try to avoid immediate collision when no path to food exists."""
         head = self.game.snake[0]
-        snake_set = set(self.game.snake)
+        snake_set = self.game.snake_cells
 
         # Try directions in order of preference
         preferred_directions = [
@@ -1,9 +1,10 @@
 """Core game logic and state management for Snek."""
 
 import random
+from collections import deque
 
 from .config import GameConfig, default_config
-from .game_rules import Direction, GameRules, Position
+from .game_rules import DIRECTION_DELTAS, Direction, GameRules, Position
 from .worlds import WorldPath
 
 
@@ -23,13 +24,16 @@ class Game:
         self.height = height or self.config.default_grid_height
         self.rng = rng or random.Random()
 
-        self.world_path = WorldPath()
+        self.world_path = WorldPath(rng=self.rng)
+        # Cells the snake entered or left since the renderer last drained them
+        # with consume_dirty_cells; None means the whole board needs redrawing
+        self._dirty_cells: list[Position] | None = None
         self.reset()
 
     def reset(self) -> None:
         """Reset the game to initial state with snake at center."""
         mid = (self.width // 2, self.height // 2)
-        self.snake: list[Position] = [mid]
+        self.snake = [mid]
         self.direction = Direction.RIGHT
         self.symbols_consumed = 0
         self.current_world = 0
@@ -37,17 +41,36 @@ class Game:
         self.initial_interval = self.config.initial_speed_interval
         self.current_interval = self.initial_interval
         self.game_over = False
+        # Set when the game ended because the snake filled the whole board
+        self.board_full = False
         self.paused = False
         self.place_food()
 
     def place_food(self) -> None:
         """Place food at a random empty position on the grid."""
-        while True:
-            pos = (self.rng.randrange(self.width), self.rng.randrange(self.height))
-            if pos not in self.snake:
-                self.food = pos
-                self.food_emoji = self.world_path.get_food_character(self.current_world)
+        width, height = self.width, self.height
+        occupied = self.snake_cells
+        if width * height - len(occupied) < width * height // 4:
+            # Board is mostly snake, so rejection sampling would retry often
+            free = [
+                (x, y)
+                for y in range(height)
+                for x in range(width)
+                if (x, y) not in occupied
+            ]
+            if not free:
+                # The snake fills the whole board, which wins the game
+                self.board_full = True
+                self.game_over = True
                 return
+            pos = self.rng.choice(free)
+        else:
+            while True:
+                pos = (self.rng.randrange(width), self.rng.randrange(height))
+                if pos not in occupied:
+                    break
+        self.food = pos
+        self.food_emoji = self.world_path.get_food_character(self.current_world)
 
     def turn(self, new_direction: Direction) -> None:
         """Change snake direction if the turn is valid (not reversing)."""
@@ -58,24 +81,31 @@ class Game:
         """Advance the game by one step: move snake, check collisions, handle food."""
         if self.game_over or self.paused:
             return
-        new_head_pos = GameRules.calculate_new_position(
-            self.snake[0], self.direction, self.width, self.height
-        )
-        grows = GameRules.is_food_collision(new_head_pos, self.food)
-        # Only include the tail in collision check if we grow this turn
-        body_to_check = self.snake if grows else self.snake[:-1]
-        if GameRules.is_self_collision(new_head_pos, body_to_check):
+        snake, snake_cells = self.snake, self.snake_cells
+        # Inlined GameRules.calculate_new_position
+        head_x, head_y = snake[0]
+        dx, dy = DIRECTION_DELTAS[self.direction]
+        new_head_pos = ((head_x + dx) % self.width, (head_y + dy) % self.height)
+        # Inlined GameRules.is_food_collision / is_self_collision
+        grows = new_head_pos == self.food
+        # The tail moves out of the way this turn unless we grow
+        vacated_tail = None if grows else snake[-1]
+        if new_head_pos != vacated_tail and new_head_pos in snake_cells:
             self.game_over = True
             return
 
-        self.snake.insert(0, new_head_pos)
+        if not grows:
+            tail = snake.pop()
+            snake_cells.discard(tail)
+            self._mark_dirty(tail)
+        snake.appendleft(new_head_pos)
+        snake_cells.add(new_head_pos)
+        self._mark_dirty(new_head_pos)
         if grows:
             self.symbols_consumed += 1
             self.symbols_in_current_world += 1
             self.check_world_transition()
             self.place_food()
-        else:
-            self.snake.pop()
 
     def check_world_transition(self) -> None:
         """Check if player should move to next world."""
@@ -94,15 +124,58 @@ class Game:
     def resize(self, new_width: int, new_height: int) -> None:
         """Resize grid and scale snake and food positions."""
         old_width, old_height = self.width, self.height
-        self.snake = [
-            GameRules.scale_position(pos, old_width, old_height, new_width, new_height)
-            for pos in self.snake
+        # Same integer scaling as GameRules.scale_position, inlined because the
+        # snake can be long; in-bounds cells never need the upper clamp
+        scaled = [
+            (x * new_width // old_width, y * new_height // old_height)
+            for x, y in self.snake
         ]
+        # Shrinking can map several segments onto one cell; keep the first
+        # (closest to the head) so every cell holds at most one segment
+        self.snake = list(dict.fromkeys(scaled))
         self.food = GameRules.scale_position(
             self.food, old_width, old_height, new_width, new_height
         )
         self.width, self.height = new_width, new_height
 
+    @property
+    def snake(self) -> deque[Position]:
+        """Snake body positions, head first."""
+        return self._snake
+
+    @snake.setter
+    def snake(self, positions: list[Position]) -> None:
+        """Replace the snake body, keeping the cell set in sync."""
+        snake = deque(positions)
+        # Set of occupied cells for O(1) membership tests; step relies on each
+        # cell holding at most one segment when it discards the tail
+        snake_cells = set(snake)
+        if len(snake_cells) != len(snake):
+            raise ValueError("Snake positions must be distinct")
+        self._snake = snake
+        self.snake_cells = snake_cells
+        # The whole snake was replaced, so the whole board needs redrawing
+        self._dirty_cells = None
+
+    def _mark_dirty(self, position: Position) -> None:
+        """Record that the snake's occupancy of a cell has changed."""
+        if self._dirty_cells is None:
+            return
+        self._dirty_cells.append(position)
+        if len(self._dirty_cells) > self.width * self.height:
+            # Nobody is draining the log; a full redraw is cheaper past this point
+            self._dirty_cells = None
+
+    def consume_dirty_cells(self) -> list[Position] | None:
+        """Return the cells changed by the snake since the last call.
+
+        Returns None when the snake was replaced wholesale (reset, resize, etc.)
+        and the whole board needs redrawing.
+        """
+        dirty_cells = self._dirty_cells
+        self._dirty_cells = []
+        return dirty_cells
+
     @property
     def is_running(self) -> bool:
         """Check if game is in a running state."""
@@ -13,37 +13,40 @@ class Direction(Enum):
     RIGHT = auto()
 
 
+OPPOSITE_DIRECTIONS = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
+DIRECTION_DELTAS = {
+    Direction.UP: (0, -1),
+    Direction.DOWN: (0, 1),
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0),
+}
+
+
 class GameRules:
     """Pure game logic and rules, separated from state."""
 
     @staticmethod
     def get_opposite_direction(direction: Direction) -> Direction:
         """Get the opposite direction."""
-        opposites = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }
-        return opposites[direction]
+        return OPPOSITE_DIRECTIONS[direction]
 
     @staticmethod
     def is_valid_turn(current: Direction, new: Direction) -> bool:
         """Check if a turn is valid (not reversing into itself)."""
-        return new != GameRules.get_opposite_direction(current)
+        return new != OPPOSITE_DIRECTIONS[current]
 
     @staticmethod
     def calculate_new_position(
         head: Position, direction: Direction, width: int, height: int
     ) -> Position:
         """Calculate new head position based on direction, with wrapping."""
-        delta = {
-            Direction.UP: (0, -1),
-            Direction.DOWN: (0, 1),
-            Direction.LEFT: (-1, 0),
-            Direction.RIGHT: (1, 0),
-        }[direction]
-
+        delta = DIRECTION_DELTAS[direction]
         new_x = (head[0] + delta[0]) % width
         new_y = (head[1] + delta[1]) % height
         return (new_x, new_y)
@@ -63,6 +66,6 @@ class GameRules:
         pos: Position, old_width: int, old_height: int, new_width: int, new_height: int
     ) -> Position:
         """Scale a position from old dimensions to new dimensions."""
-        scaled_x = min(int(pos[0] * new_width / old_width), new_width - 1)
-        scaled_y = min(int(pos[1] * new_height / old_height), new_height - 1)
+        scaled_x = min(pos[0] * new_width // old_width, new_width - 1)
+        scaled_y = min(pos[1] * new_height // old_height, new_height - 1)
         return (scaled_x, scaled_y)
@@ -3,8 +3,8 @@
 from rich.text import Text
 from textual import events
 from textual.app import ComposeResult
-from textual.reactive import reactive
 from textual.containers import Horizontal, Vertical
+from textual.geometry import Size
 from textual.screen import ModalScreen, Screen
 from textual.timer import Timer
 from textual.widgets import Label, Static
@@ -14,7 +14,7 @@ from . import __version__
 from .config import GameConfig, default_config
 from .demo_ai import DemoAI
 from .game import Game
-from .game_rules import Direction
+from .game_rules import Direction, Position
 
 
 class SplashScreen(Screen):
@@ -53,6 +53,14 @@ class SplashScreen(Screen):
         """Fade in the splash screen on load."""
         self.styles.animate("opacity", value=1.0, duration=1.0)
 
+    def on_screen_suspend(self) -> None:
+        """Stop animating the title while another screen covers the splash."""
+        self.query_one("#splash-title", FigletWidget).animated = False
+
+    def on_screen_resume(self) -> None:
+        """Resume animating the title when the splash is shown again."""
+        self.query_one("#splash-title", FigletWidget).animated = True
+
     def action_start_game(self) -> None:
         """Start the game."""
         game_screen = GameScreen()
@@ -85,11 +93,6 @@ class GameScreen(Screen):
         ("q", "quit", "Quit"),
     ]
 
-    foods_eaten = reactive(0)
-    speed = reactive(0.0)
-    world_index = reactive(0)
-    symbols_in_world = reactive(0)
-
     def __init__(self, config: GameConfig = None, demo_mode: bool = False) -> None:
         super().__init__()
         self.config = config or default_config
@@ -99,6 +102,8 @@ class GameScreen(Screen):
         self.stats_widget: SidePanel | None = None
         self.timer: Timer
         self.interval: float = self.config.initial_speed_interval
+        self._timer_interval: float = self.interval
+        self._last_stats: tuple | None = None
         self.sidebar_visible: bool = True
 
     def compose(self) -> ComposeResult:
@@ -111,6 +116,7 @@ class GameScreen(Screen):
     def on_mount(self) -> None:
         """Start the game timer and set initial theme when the screen mounts."""
         self.timer = self.set_interval(self.interval, self.tick)
+        self._timer_interval = self.interval
 
         self.app.theme = self.game.world_path.get_world(0).theme_name
 
@@ -119,62 +125,81 @@ class GameScreen(Screen):
         self.timer.stop()
 
     def _restart_timer(self) -> None:
-        """Helper to restart the game timer with current interval."""
+        """Helper to restart the game timer with current interval.
+
+        Textual timers fix their interval when they start, so a new timer is
+        only created when the speed has changed; otherwise the existing timer is
+        reset and reused.
+        """
+        if self.interval == self._timer_interval:
+            self.timer.reset()
+            return
         self.timer.stop()
         self.timer = self.set_interval(self.interval, self.tick)
+        self._timer_interval = self.interval
 
     def tick(self) -> None:
         """Game tick - advance game state."""
+        game = self.game
         if self.demo_ai:
             # In demo mode, let the AI choose the direction
             ai_direction = self.demo_ai.get_next_direction()
             if ai_direction:
-                self.game.turn(ai_direction)
+                game.turn(ai_direction)
 
-        pre_length = len(self.game.snake)
-        old_world = self.game.current_world
-        self.game.step()
+        pre_length = len(game.snake)
+        old_world = game.current_world
+        game.step()
 
-        if self.game.current_world != old_world:
+        if game.current_world != old_world:
             # World changed; update theme
-            self.app.theme = self.game.world_path.get_world(
-                self.game.current_world
-            ).theme_name
-
-        if self.game.game_over:
-            # Stop the timer to prevent multiple game over modals
-            self.timer.stop()
-            self.app.push_screen(GameOverModal())
+            self.app.theme = game.world_path.get_world(game.current_world).theme_name
+
+        if game.game_over:
+            # Pause the timer to prevent multiple game over modals
+            self.timer.pause()
+            # Filling the board changes it, so the board under the modal must
+            # redraw to show the final move
+            if self.view_widget:
+                self.view_widget.refresh()
+            self.app.push_screen("game-over")
             return
 
-        if len(self.game.snake) > pre_length:
+        if len(game.snake) > pre_length:
             # Snake ate food; increase speed
             self.interval *= self.config.speed_increase_factor
             self._restart_timer()
-            self.game.update_speed(self.interval)
-
-        # Update reactive fields
-        self.foods_eaten = self.game.symbols_consumed
-        self.speed = self.game.get_moves_per_second()
-        self.world_index = self.game.current_world
-        self.symbols_in_world = self.game.symbols_in_current_world
+            game.update_speed(self.interval)
+
+        # Repaint the board and side panel together in one compositor pass
+        with self.app.batch_update():
+            self._update_stats()
+            if self.view_widget:
+                self.view_widget.refresh()
+
+    def _update_stats(self) -> None:
+        """Push game stats to the side panel, skipping unchanged snapshots."""
+        stats = (
+            self.game.symbols_consumed,
+            self.game.get_moves_per_second(),
+            self.game.current_world,
+            self.game.symbols_in_current_world,
+        )
+        if stats == self._last_stats:
+            # Most ticks only move the snake
+            return
+        self._last_stats = stats
 
-        # Update stats-panel reactive fields
+        # Update every stat label in one pass
         if self.stats_widget:
-            self.stats_widget.foods_eaten = self.game.symbols_consumed
-            self.stats_widget.speed = self.game.get_moves_per_second()
-            self.stats_widget.world_index = self.game.current_world
-            self.stats_widget.symbols_in_world = self.game.symbols_in_current_world
-
-        if self.view_widget:
-            self.view_widget.refresh()
+            self.stats_widget.update_content()
 
     def action_pause(self) -> None:
         """Pause the game."""
         if not self.game.game_over:
             self.game.paused = True
             self.timer.pause()
-            self.app.push_screen(PauseModal())
+            self.app.push_screen("pause")
 
     def action_toggle_sidebar(self) -> None:
         """Toggle sidebar visibility."""
@@ -188,10 +213,8 @@ class GameScreen(Screen):
             # Don't allow manual control in demo mode
             return
 
+        # Turning doesn't move the snake; the next tick repaints the grid
         self.game.turn(Direction[dir_name])
-        if self.view_widget:
-            # Force a refresh after key press to show immediate response
-            self.view_widget.refresh()
 
     def action_quit(self) -> None:
         """Quit the application."""
@@ -212,27 +235,32 @@ class GameScreen(Screen):
         self.interval = self.config.initial_speed_interval
         self._restart_timer()
 
-        # Update reactive fields
-        self.foods_eaten = self.game.symbols_consumed
-        self.speed = self.game.get_moves_per_second()
-        self.world_index = self.game.current_world
-        self.symbols_in_world = self.game.symbols_in_current_world
+        with self.app.batch_update():
+            self._update_stats()
 
-        # Update stats-panel
-        if self.stats_widget:
-            self.stats_widget.foods_eaten = self.game.symbols_consumed
-            self.stats_widget.speed = self.game.get_moves_per_second()
-            self.stats_widget.world_index = self.game.current_world
-            self.stats_widget.symbols_in_world = self.game.symbols_in_current_world
+            # Update theme to initial world before refreshing view
+            self.app.theme = self.game.world_path.get_world(0).theme_name
+
+            if self.view_widget:
+                self.view_widget.refresh()
 
-        # Update theme to initial world before refreshing view
-        self.app.theme = self.game.world_path.get_world(0).theme_name
 
-        if self.view_widget:
-            self.view_widget.refresh()
+class GameModal(ModalScreen):
+    """Base class for modal screens shown over the game screen."""
 
+    def _game_screen(self) -> GameScreen | None:
+        """Find the game screen this modal was shown over."""
+        for screen in self.app.screen_stack:
+            if isinstance(screen, GameScreen):
+                return screen
+        return None
 
-class PauseModal(ModalScreen):
+    def action_quit(self) -> None:
+        """Quit the application."""
+        self.app.exit()
+
+
+class PauseModal(GameModal):
     """Modal screen shown when game is paused."""
 
     BINDINGS = [
@@ -260,19 +288,13 @@ class PauseModal(ModalScreen):
 
     def action_resume(self) -> None:
         """Resume the game."""
-        for screen in self.app.screen_stack:
-            if isinstance(screen, GameScreen):
-                screen.resume_game()
-                break
+        if game_screen := self._game_screen():
+            game_screen.resume_game()
         self.dismiss()
 
-    def action_quit(self) -> None:
-        """Quit the application."""
-        self.app.exit()
 
-
-class GameOverModal(ModalScreen):
-    """Modal screen shown when snek dies."""
+class GameOverModal(GameModal):
+    """Modal screen shown when snek dies or fills the board."""
 
     BINDINGS = [
         ("space", "restart", "Restart"),
@@ -290,18 +312,27 @@ class GameOverModal(ModalScreen):
                 colors=["$primary"],
                 classes="title-text",
             )
-            yield Static("💀 SNEK DIED! 💀", classes="death-message")
+            yield Static(
+                "💀 SNEK DIED! 💀", id="death-message", classes="death-message"
+            )
             yield Static(
                 "Press SPACE to restart, ENTER for main menu, or Q to quit",
                 classes="death-prompt",
             )
 
+    def on_screen_resume(self) -> None:
+        """Show whether this game ended in a death or a full board."""
+        game_screen = self._game_screen()
+        if game_screen and game_screen.game.board_full:
+            message = "🏆 SNEK FILLED THE BOARD! 🏆"
+        else:
+            message = "💀 SNEK DIED! 💀"
+        self.query_one("#death-message", Static).update(message)
+
     def action_restart(self) -> None:
         """Restart the game in the same mode (user/demo)."""
-        for screen in self.app.screen_stack:
-            if isinstance(screen, GameScreen):
-                screen.restart_game()
-                break
+        if game_screen := self._game_screen():
+            game_screen.restart_game()
         self.dismiss()
 
     def action_menu(self) -> None:
@@ -309,10 +340,6 @@ class GameOverModal(ModalScreen):
         self.app.pop_screen()  # Remove GameOverModal
         self.app.pop_screen()  # Remove GameScreen
 
-    def action_quit(self) -> None:
-        """Quit the application."""
-        self.app.exit()
-
 
 class SnakeView(Static):
     """Renders the game as text."""
@@ -320,53 +347,132 @@ class SnakeView(Static):
     def __init__(self, game: Game) -> None:
         super().__init__()
         self.game = game
+        # Glyphs are fixed for the lifetime of the view
+        self._snake_block = game.config.snake_block
+        self._empty_cell = game.config.empty_cell
+        # Grid buffer and joined rows reused across frames; only cells the game
+        # reports as changed are repainted
+        self._grid: list[list[str]] = []
+        self._rows: list[str] = []
+        self._grid_size: tuple[int, int] = (0, 0)
+        self._food_cell: tuple[Position, str] | None = None
+        self._frame: Text | None = None
+        self._resize_timer: Timer | None = None
+        # Widget size the grid was last fitted to
+        self._applied_size: Size | None = None
 
     def on_resize(self, event: events.Resize) -> None:
-        """React to available space changes."""
-        if self.game and self.size.width > 0 and self.size.height > 0:
+        """React to available space changes.
+
+        Terminal drags produce a burst of resize events, so the grid is resized
+        for the first event of a burst and again once the events settle, rather
+        than once per event. The settled pass is skipped when the size has not
+        changed since the first one.
+        """
+        if self._resize_timer is None:
+            self._apply_resize()
+        else:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(
+            self.game.config.resize_settle_delay, self._finish_resize
+        )
+
+    def _finish_resize(self) -> None:
+        """Apply the final size once a burst of resize events has settled."""
+        self._resize_timer = None
+        if self.size != self._applied_size:
+            self._apply_resize()
+
+    def _apply_resize(self) -> None:
+        """Resize the game grid to fit the available space."""
+        self._applied_size = self.size
+        width, height = self.size
+        if self.game and width > 0 and height > 0:
             # Calculate grid size based on available space
-            game_width = max(self.game.config.min_game_width, self.size.width // 2)
-            game_height = max(self.game.config.min_game_height, self.size.height)
+            config = self.game.config
+            game_width = max(config.min_game_width, width // 2)
+            game_height = max(config.min_game_height, height)
             self.game.resize(game_width, game_height)
             self.refresh()
 
     def render(self) -> Text:
         """Render the game grid using solid block symbols for the snake."""
-        width, height = self.game.width, self.game.height
-        empty_cell = self.game.config.empty_cell
-        food_emoji = self.game.food_emoji
-        snake_block = self.game.config.snake_block
-        food_pos = self.game.food
-
-        snake_positions = set(self.game.snake)
-        rows = []
-        for y in range(height):
-            row_parts = []
-            for x in range(width):
-                pos = (x, y)
-                if pos in snake_positions:
-                    row_parts.append(snake_block)
-                elif pos == food_pos:
-                    row_parts.append(f"{food_emoji} ")
-                else:
-                    row_parts.append(empty_cell)
-            rows.append("".join(row_parts))
-        return Text("\n".join(rows))
+        game = self.game
+        width, height = game.width, game.height
+        food_cell = (game.food, f"{game.food_emoji} ")
+        dirty_cells = game.consume_dirty_cells()
+
+        if dirty_cells is None or (width, height) != self._grid_size:
+            self._redraw(width, height, food_cell)
+        else:
+            if food_cell != self._food_cell:
+                dirty_cells.append(self._food_cell[0])
+                dirty_cells.append(food_cell[0])
+                self._food_cell = food_cell
+            if not dirty_cells and self._frame is not None:
+                # Nothing visible has changed since the last frame
+                return self._frame
+            self._repaint(dirty_cells)
+
+        self._frame = Text("\n".join(self._rows))
+        return self._frame
+
+    def _redraw(self, width: int, height: int, food_cell: tuple[Position, str]) -> None:
+        """Rebuild the whole grid from the current game state."""
+        snake_block = self._snake_block
+        grid = [[self._empty_cell] * width for _ in range(height)]
+        (food_x, food_y), food_glyph = food_cell
+        grid[food_y][food_x] = food_glyph
+        occupied_rows = {food_y}
+        for x, y in self.game.snake:
+            grid[y][x] = snake_block
+            occupied_rows.add(y)
+
+        # Rows with no snake or food share one pre-joined string
+        empty_row = self._empty_cell * width
+        self._grid = grid
+        self._rows = [
+            "".join(row) if y in occupied_rows else empty_row
+            for y, row in enumerate(grid)
+        ]
+        self._grid_size = (width, height)
+        self._food_cell = food_cell
+
+    def _repaint(self, cells: list[Position]) -> None:
+        """Repaint only the given cells and re-join the rows they are on."""
+        grid, rows = self._grid, self._rows
+        snake_block, empty_cell = self._snake_block, self._empty_cell
+        snake_cells = self.game.snake_cells
+        food_pos, food_glyph = self._food_cell
+        dirty_rows = set()
+        for cell in cells:
+            x, y = cell
+            if cell in snake_cells:
+                grid[y][x] = snake_block
+            elif cell == food_pos:
+                grid[y][x] = food_glyph
+            else:
+                grid[y][x] = empty_cell
+            dirty_rows.add(y)
+        for y in dirty_rows:
+            rows[y] = "".join(grid[y])
 
 
 class SidePanel(Static):
     """Panel showing game statistics."""
 
-    foods_eaten = reactive(0)
-    speed = reactive(0.0)
-    world_index = reactive(0)
-    symbols_in_world = reactive(0)
-
     def __init__(self, game: Game) -> None:
         super().__init__()
         self.game = game
         self.styles.width = self.game.config.side_panel_width
         self.styles.min_width = self.game.config.side_panel_width
+        # Stat value labels, cached on mount
+        self._world_label: Label
+        self._symbols_label: Label
+        self._foods_label: Label
+        self._speed_label: Label
+        # Last text written to each label
+        self._label_text: dict[Label, str] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the side panel with FigletWidget at bottom."""
@@ -404,36 +510,28 @@ class SidePanel(Static):
         )
 
     def on_mount(self) -> None:
-        """Update content when mounted."""
+        """Cache the stat value labels and update content when mounted."""
+        self._world_label = self.query_one("#world-value", Label)
+        self._symbols_label = self.query_one("#symbols-value", Label)
+        self._foods_label = self.query_one("#foods-value", Label)
+        self._speed_label = self.query_one("#speed-value", Label)
         self.update_content()
 
+    def _set_label(self, label: Label, text: str) -> None:
+        """Update a label, skipping the repaint when its text is unchanged."""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.update(text)
+
     def update_content(self) -> None:
         """Update the stats content."""
         world_name = self.game.world_path.get_world_name(self.game.current_world)
-        self.query_one("#world-value", Label).update(world_name)
-        self.query_one("#symbols-value", Label).update(
-            f"{self.game.symbols_in_current_world}/{self.game.config.symbols_per_world}"
+        self._set_label(self._world_label, world_name)
+        self._set_label(
+            self._symbols_label,
+            f"{self.game.symbols_in_current_world}/{self.game.config.symbols_per_world}",
         )
-        self.query_one("#foods-value", Label).update(str(self.game.symbols_consumed))
-        self.query_one("#speed-value", Label).update(
-            f"{self.game.get_moves_per_second():.1f}/sec"
-        )
-
-    def watch_foods_eaten(self, value: int) -> None:
-        """React to foods eaten changes."""
-        self.query_one("#foods-value", Label).update(str(value))
-
-    def watch_speed(self, value: float) -> None:
-        """React to speed changes."""
-        self.query_one("#speed-value", Label).update(f"{value:.1f}/sec")
-
-    def watch_world_index(self, value: int) -> None:
-        """React to world index changes."""
-        world_name = self.game.world_path.get_world_name(value)
-        self.query_one("#world-value", Label).update(world_name)
-
-    def watch_symbols_in_world(self, value: int) -> None:
-        """React to symbols in current world changes."""
-        self.query_one("#symbols-value", Label).update(
-            f"{value}/{self.game.config.symbols_per_world}"
+        self._set_label(self._foods_label, str(self.game.symbols_consumed))
+        self._set_label(
+            self._speed_label, f"{self.game.get_moves_per_second():.1f}/sec"
         )
@@ -2,6 +2,7 @@
 
 import pytest
 from snek.config import GameConfig
+from snek.worlds import WorldPath
 
 
 @pytest.fixture
@@ -13,12 +14,12 @@ def default_config():
 @pytest.fixture
 def test_config():
     """Provide test-specific game configuration."""
-    config = GameConfig()
-    config.default_grid_width = 20
-    config.default_grid_height = 20
-    config.initial_speed_interval = 0.1
-    config.speed_increase_factor = 1.1
-    return config
+    return GameConfig(
+        default_grid_width=20,
+        default_grid_height=20,
+        initial_speed_interval=0.1,
+        speed_increase_factor=1.1,
+    )
 
 
 @pytest.fixture
@@ -27,3 +28,15 @@ def mock_rng():
     import random
 
     return random.Random(42)
+
+
+@pytest.fixture(scope="session")
+def world_path():
+    """Provide one world path shared by tests that only read world data."""
+    return WorldPath()
+
+
+@pytest.fixture
+def fresh_world_path():
+    """Provide a new world path for tests that draw food characters."""
+    return WorldPath()
@@ -1,9 +1,10 @@
 """Integration tests for the Snek app."""
 
+from dataclasses import replace
+
 import pytest
 
 from snek.app import SnakeApp
-from snek.config import GameConfig
 from snek.game_rules import Direction
 from snek.screens import GameScreen, SplashScreen
 
@@ -22,6 +23,10 @@ async def test_start_game_from_splash():
     """Test starting game from splash screen."""
     app = SnakeApp()
     async with app.run_test() as pilot:
+        splash_screen = app.screen
+        title = splash_screen.query_one("#splash-title")
+        assert title.animated is True
+
         # Press Enter to start
         await pilot.press("space")
         await pilot.pause()
@@ -34,6 +39,13 @@ async def test_start_game_from_splash():
         assert app.screen.view_widget is not None
         assert app.screen.stats_widget is not None
 
+        # The hidden splash title stops animating until it is shown again
+        assert title.animated is False
+        app.pop_screen()
+        await pilot.pause()
+        assert app.screen is splash_screen
+        assert title.animated is True
+
 
 @pytest.mark.asyncio
 async def test_game_controls():
@@ -96,6 +108,12 @@ async def test_pause_functionality():
         await pilot.pause()
         assert game_screen.game.paused is False
 
+        # Pausing again reuses the same installed modal
+        pause_modal = app.get_screen("pause")
+        await pilot.press("space")
+        await pilot.pause()
+        assert app.screen is pause_modal
+
 
 @pytest.mark.asyncio
 async def test_game_over_and_restart():
@@ -148,6 +166,72 @@ async def test_game_over_and_restart():
         )  # Should have initial snake length
 
 
+@pytest.mark.asyncio
+async def test_filling_board_shows_final_move_and_win():
+    """Test filling the board draws the final move and reports a win."""
+    from textual.widgets import Static
+
+    from snek.screens import GameOverModal
+
+    app = SnakeApp()
+    async with app.run_test() as pilot:
+        await pilot.press("space")
+        await pilot.pause()
+
+        game_screen = app.screen
+        assert isinstance(game_screen, GameScreen)
+        game = game_screen.game
+        view = game_screen.view_widget
+        # Drive ticks by hand so the live timer cannot move the snake
+        game_screen.timer.pause()
+
+        # One free cell left, just ahead of the head
+        game.resize(2, 2)
+        game.snake = [(0, 0), (0, 1), (1, 1)]
+        game.direction = Direction.RIGHT
+        game.set_food_position((1, 0))
+        food_emoji = game.food_emoji
+
+        game_screen.tick()
+        await pilot.pause()
+
+        modal = app.screen
+        assert isinstance(modal, GameOverModal)
+        message = str(modal.query_one("#death-message", Static).render())
+        assert "FILLED THE BOARD" in message
+        # Paint the board the way the modal's translucent background does
+        view.render_line(0)
+        rows = view._frame.plain.splitlines()
+        assert len(rows) == 2
+        # The eaten food was redrawn as the snake's head
+        assert food_emoji not in view._frame.plain
+
+
+@pytest.mark.asyncio
+async def test_restart_reuses_timer_when_speed_unchanged():
+    """Test restarting only recreates the game timer when the speed changed."""
+    app = SnakeApp()
+    async with app.run_test() as pilot:
+        await pilot.press("space")
+        await pilot.pause()
+
+        game_screen = app.screen
+        assert isinstance(game_screen, GameScreen)
+        # Stop live ticks, which could eat food and change the speed
+        game_screen.timer.pause()
+        game_screen.restart_game()
+        timer = game_screen.timer
+
+        # Nothing ticks between restarts, so the speed is unchanged
+        game_screen.restart_game()
+        assert game_screen.timer is timer
+
+        # A speed change needs a new timer
+        game_screen.interval /= 2
+        game_screen._restart_timer()
+        assert game_screen.timer is not timer
+
+
 @pytest.mark.asyncio
 async def test_quit_from_game():
     """Test quitting from game exits the app."""
@@ -169,7 +253,7 @@ async def test_quit_from_game():
 
 @pytest.mark.asyncio
 async def test_stats_panel_updates():
-    """Test stats panel updates with game state."""
+    """Test stats panel shows the current game state."""
     app = SnakeApp()
     async with app.run_test() as pilot:
         # Start game
@@ -179,7 +263,6 @@ async def test_stats_panel_updates():
         game_screen = app.screen
         assert isinstance(game_screen, GameScreen)
 
-        # Get initial stats
         stats = game_screen.stats_widget
         game = game_screen.game
 
@@ -187,55 +270,38 @@ async def test_stats_panel_updates():
         game.symbols_consumed = 10
         game.current_world = 1
 
-        # The stats panel should update when we call update_content
         stats.update_content()
         await pilot.pause()
 
-        # Check if the game state was actually updated
-        assert game.symbols_consumed == 10
-        assert game.current_world == 1
-
-        # Check the stats panel's internal state
-        assert stats.game.symbols_consumed == 10
-        assert stats.game.current_world == 1
+        assert str(stats._foods_label.render()) == "10"
+        assert str(stats._world_label.render()) == game.world_path.get_world_name(1)
 
 
 @pytest.mark.asyncio
-async def test_theme_changes_with_world():
-    """Test theme changes when world changes."""
-    config = GameConfig()
-    app = SnakeApp(config=config)
-
+async def test_world_transition_switches_app_theme():
+    """Test eating the last food of a world switches the app to the next theme."""
+    app = SnakeApp()
     async with app.run_test() as pilot:
-        # Start game
         await pilot.press("space")
         await pilot.pause()
 
         game_screen = app.screen
         assert isinstance(game_screen, GameScreen)
         game = game_screen.game
-
-        # Store initial theme and old world for comparison
+        # Drive ticks by hand so the live timer cannot move the snake
+        game_screen.timer.pause()
         initial_theme = app.theme
-        old_world = game.current_world
-
-        # Force world change by consuming enough symbols to get to a world with a different theme
-        # World 0 uses 'snek-classic', world 1 uses 'snek-ocean'
-        game.symbols_consumed = config.symbols_per_world
-        game.symbols_in_current_world = config.symbols_per_world
-        game.check_world_transition()
-        await pilot.pause()
-
-        # World should have changed
-        assert game.current_world == old_world + 1
 
-        # Manually trigger theme change since we bypassed the normal game step
-        if game.current_world != old_world:
-            app.theme = game.world_path.get_world(game.current_world).theme_name
+        # One food short of the next world, with food just ahead of the head
+        game.symbols_in_current_world = game.config.symbols_per_world - 1
+        head_x, head_y = game.snake[0]
+        game.direction = Direction.RIGHT
+        game.set_food_position(((head_x + 1) % game.width, head_y))
 
+        game_screen.tick()
         await pilot.pause()
 
-        # Theme should have changed (world 1 has 'snek-ocean' theme)
+        assert game.current_world == 1
         assert app.theme != initial_theme
         assert app.theme == "snek-ocean"
 
@@ -267,6 +333,62 @@ async def test_resize_handling():
         assert game_screen.game.height > 0
 
 
+@pytest.mark.asyncio
+async def test_resize_events_are_debounced():
+    """Test a burst of resize events resizes the grid only at its start and end."""
+    from textual.events import Resize
+    from textual.geometry import Size
+
+    app = SnakeApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.press("space")
+        await pilot.pause()
+
+        game_screen = app.screen
+        assert isinstance(game_screen, GameScreen)
+        game = game_screen.game
+        view = game_screen.view_widget
+        # A settle delay the test never reaches, so bursts are settled by hand
+        game.config = replace(game.config, resize_settle_delay=60.0)
+
+        def settle() -> None:
+            """Fire the pending settle timer now instead of waiting for it."""
+            if view._resize_timer is not None:
+                view._resize_timer.stop()
+                view._finish_resize()
+
+        # Settle the resize from mounting the view, if it is still pending
+        settle()
+
+        sizes = []
+        original_resize = game.resize
+
+        def recording_resize(width: int, height: int) -> None:
+            sizes.append((width, height))
+            original_resize(width, height)
+
+        game.resize = recording_resize
+
+        # The size never changes after the first event, so only it resizes
+        for _ in range(5):
+            view.on_resize(Resize(Size(100, 30), Size(100, 30)))
+        assert len(sizes) == 1
+
+        settle()
+        assert len(sizes) == 1
+
+        # A size change during the burst is applied once it settles
+        view.on_resize(Resize(Size(100, 30), Size(100, 30)))
+        await pilot.resize_terminal(100, 30)
+        await pilot.pause()
+        assert len(sizes) == 2
+
+        settle()
+        assert len(sizes) == 3
+        assert sizes[-1] == (game.width, game.height)
+        assert sizes[-1] != sizes[-2]
+
+
 class TestWorldProgression:
     """Test world progression."""
 
@@ -285,6 +407,21 @@ class TestWorldProgression:
         game.check_world_transition()
         assert game.current_world == 2
 
+    def test_world_transition_selects_next_theme(self):
+        """Test moving to the next world selects that world's theme."""
+        from snek.game import Game
+
+        game = Game()
+        initial_theme = game.world_path.get_world(game.current_world).theme_name
+
+        # World 0 uses 'snek-classic', world 1 uses 'snek-ocean'
+        game.symbols_in_current_world = game.config.symbols_per_world
+        game.check_world_transition()
+
+        theme = game.world_path.get_world(game.current_world).theme_name
+        assert theme != initial_theme
+        assert theme == "snek-ocean"
+
     def test_update_speed(self):
         """Test speed update mechanism."""
         from snek.game import Game
@@ -309,3 +446,83 @@ class TestWorldProgression:
 
         game.current_interval = 0.5
         assert game.get_moves_per_second() == 2.0
+
+
+class TestSnakeView:
+    """Test rendering of the game grid."""
+
+    def test_render_grid(self):
+        """Test snake and food cells are painted onto an empty grid."""
+        from snek.game import Game
+        from snek.screens import SnakeView
+
+        game = Game(width=4, height=3)
+        game.snake = [(1, 1), (0, 1)]
+        game.set_food_position((3, 2), emoji="*")
+
+        rows = SnakeView(game).render().plain.split("\n")
+
+        assert rows == [
+            "        ",
+            "████    ",
+            "      * ",
+        ]
+
+    def test_render_clears_previous_frame(self):
+        """Test cells painted in an earlier frame are cleared on the next one."""
+        from snek.game import Game
+        from snek.screens import SnakeView
+
+        game = Game(width=4, height=2)
+        game.snake = [(1, 0), (0, 0)]
+        game.set_food_position((3, 1), emoji="*")
+        view = SnakeView(game)
+        view.render()
+
+        game.snake = [(2, 1)]
+        game.set_food_position((0, 1), emoji="+")
+
+        assert view.render().plain.split("\n") == [
+            "        ",
+            "+   ██  ",
+        ]
+
+    def test_render_reuses_unchanged_frame(self):
+        """Test the frame is only rebuilt when the game state changes."""
+        from snek.game import Game
+        from snek.screens import SnakeView
+
+        game = Game(width=10, height=10)
+        game.set_food_position((0, 0))
+        view = SnakeView(game)
+
+        frame = view.render()
+        assert view.render() is frame
+
+        game.step()
+        assert view.render() is not frame
+
+    def test_incremental_render_matches_full_grid(self):
+        """Test repainting only changed cells matches drawing the whole grid."""
+        import random
+
+        from snek.game import Game
+        from snek.screens import SnakeView
+
+        game = Game(width=8, height=6, rng=random.Random(1))
+        view = SnakeView(game)
+        turns = random.Random(2)
+
+        for _ in range(200):
+            game.turn(turns.choice(list(Direction)))
+            game.step()
+            if game.game_over:
+                game.reset()
+
+            grid = [["  "] * game.width for _ in range(game.height)]
+            grid[game.food[1]][game.food[0]] = f"{game.food_emoji} "
+            for x, y in game.snake:
+                grid[y][x] = "██"
+            expected = "\n".join("".join(row) for row in grid)
+
+            assert view.render().plain == expected
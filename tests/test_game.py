@@ -73,6 +73,27 @@ class TestFoodPlacement:
         assert game.food not in game.snake
         assert game.food[1] == 4  # Only row 4 is free
 
+    def test_place_food_with_one_free_cell(self):
+        """Test food lands on the only free cell of a nearly full grid."""
+        game = Game(width=5, height=5)
+        game.snake = [(x, y) for x in range(5) for y in range(5) if (x, y) != (2, 3)]
+
+        game.place_food()
+
+        assert game.food == (2, 3)
+
+    def test_eating_last_free_cell_ends_game(self):
+        """Test filling the whole grid ends the game instead of placing food."""
+        game = Game(width=2, height=2)
+        game.snake = [(0, 0), (0, 1), (1, 1)]
+        game.set_food_position((1, 0))
+
+        game.step()
+
+        assert game.game_over is True
+        assert game.board_full is True
+        assert len(game.snake) == 4
+
 
 class TestMovement:
     """Test snake movement mechanics."""
@@ -141,6 +162,64 @@ class TestMovement:
 
         assert game.game_over is True
 
+    def test_step_into_vacated_tail(self):
+        """Test moving into the cell the tail leaves is not a collision."""
+        game = Game(width=10, height=10)
+        game.snake = [(5, 5), (5, 4), (4, 4), (4, 5)]
+        game.set_food_position((0, 0))
+        game.direction = Direction.LEFT  # Will move onto the tail at (4, 5)
+
+        game.step()
+
+        assert game.game_over is False
+        assert list(game.snake) == [(4, 5), (5, 5), (5, 4), (4, 4)]
+        assert game.snake_cells == set(game.snake)
+
+    def test_snake_cells_track_snake(self):
+        """Test the occupied-cell set follows the snake as it moves and grows."""
+        game = Game(width=10, height=10)
+        game.snake = [(5, 5), (4, 5), (3, 5)]
+        game.set_food_position((7, 5))
+
+        game.step()
+        assert game.snake_cells == {(6, 5), (5, 5), (4, 5)}
+
+        game.step()  # Eats the food
+        assert game.snake_cells == {(7, 5), (6, 5), (5, 5), (4, 5)}
+        assert game.food not in game.snake_cells
+
+    def test_snake_rejects_repeated_cells(self):
+        """Test the snake cannot hold the same cell twice."""
+        game = Game(width=10, height=10)
+
+        with pytest.raises(ValueError):
+            game.snake = [(5, 5), (4, 5), (5, 5)]
+
+    def test_step_after_shrinking_resize(self):
+        """Test the cell set still matches the snake after a shrink and a step."""
+        game = Game(width=20, height=10)
+        game.snake = [(6, 5), (5, 5), (4, 5), (3, 5)]
+        game.set_food_position((0, 0))
+
+        game.resize(10, 10)
+        game.step()
+
+        assert game.snake_cells == set(game.snake)
+        assert len(game.snake_cells) == len(game.snake)
+
+    def test_dirty_cells(self):
+        """Test step records the cells the snake entered and left."""
+        game = Game(width=10, height=10)
+        game.snake = [(5, 5), (4, 5)]
+        game.set_food_position((0, 0))
+
+        # Replacing the snake needs a full redraw
+        assert game.consume_dirty_cells() is None
+
+        game.step()
+        assert game.consume_dirty_cells() == [(4, 5), (6, 5)]
+        assert game.consume_dirty_cells() == []
+
     def test_step_when_paused(self):
         """Test no movement when paused."""
         game = Game()
@@ -180,9 +259,27 @@ class TestResize:
         assert game.height == 20
 
         # Check positions scaled
-        assert game.snake == [(10, 10), (8, 10), (6, 10)]
+        assert list(game.snake) == [(10, 10), (8, 10), (6, 10)]
         assert game.food == (14, 14)
 
+    def test_resize_shrink_merges_overlapping_segments(self):
+        """Test shrinking never leaves two segments on the same cell."""
+        game = Game(width=20, height=10)
+        # A loop whose rows collapse onto one row when the height halves
+        game.snake = [(2, 0), (3, 0), (3, 1), (2, 1)]
+
+        game.resize(20, 5)
+
+        assert list(game.snake) == [(2, 0), (3, 0)]
+        assert game.snake_cells == set(game.snake)
+
+        # Horizontal neighbours collapse when the width halves
+        game.snake = [(5, 2), (4, 2), (3, 2), (2, 2)]
+        game.resize(10, 5)
+
+        assert list(game.snake) == [(2, 2), (1, 2)]
+        assert len(game.snake_cells) == len(game.snake)
+
     def test_resize_maintains_game_state(self):
         """Test resize preserves symbols consumed and current world."""
         game = Game()
@@ -227,7 +324,7 @@ class TestResize:
 
         # Valid positions should work
         game.set_snake_position([(5, 5), (4, 5), (3, 5)])
-        assert game.snake == [(5, 5), (4, 5), (3, 5)]
+        assert list(game.snake) == [(5, 5), (4, 5), (3, 5)]
 
         # Empty snake should raise ValueError
         with pytest.raises(ValueError, match="Snake must have at least one position"):
@@ -1,7 +1,6 @@
 """Tests for theme management."""
 
 from snek.themes import THEME_MAP
-from snek.worlds import WorldPath
 
 
 class TestThemes:
@@ -31,10 +30,8 @@ class TestThemes:
             assert theme.foreground is not None
             assert theme.dark is True  # All themes should be dark
 
-    def test_world_theme_mapping(self):
+    def test_world_theme_mapping(self, world_path):
         """Test that each world has a valid theme."""
-        world_path = WorldPath()
-
         for i in range(len(world_path.worlds)):
             world = world_path.get_world(i)
             assert hasattr(world, "theme_name")
@@ -1,114 +1,144 @@
 """Tests for world path functionality."""
 
+import random
+from collections import Counter
+
+import pytest
+
 from snek.worlds import WorldPath, World
 from snek.themes import THEME_MAP
 
+WORLD_ORDER = [
+    "Basic Symbols",
+    "Ancient Egypt",
+    "Classical Greece",
+    "Norse Runes",
+    "Alchemical Mysteries",
+    "Mathematical Realm",
+    "Global Currencies",
+    "Digital Age",
+]
+
+# Indices past the last world wrap back to the first
+WRAPPED_WORLD_NAMES = [
+    (8, "Basic Symbols"),
+    (9, "Ancient Egypt"),
+    (15, "Digital Age"),
+    (16, "Basic Symbols"),
+]
+
+
+FOOD_DRAWS = 10
+
+
+@pytest.fixture(scope="module")
+def food_draws():
+    """Draw world 0's food characters once from a seeded world path."""
+    world_path = WorldPath(rng=random.Random(42))
+    return [world_path.get_food_character(0) for _ in range(FOOD_DRAWS)]
+
+
+@pytest.fixture(scope="module")
+def first_world_chars(world_path):
+    """Provide the first world's characters as a set for membership checks."""
+    return frozenset(world_path.worlds[0].characters)
+
+
+@pytest.fixture(scope="module")
+def sample_world():
+    """Provide one World built from known field values."""
+    return World(
+        name="Test World",
+        description="A test world",
+        characters=("A", "B", "C"),
+        theme_name="snek-classic",
+    )
+
 
 class TestWorld:
     """Test World dataclass."""
 
-    def test_world_creation(self):
-        """Test creating a world."""
-        world = World(
-            name="Test World",
-            description="A test world",
-            characters=["A", "B", "C"],
-            theme_name="snek-classic",
-        )
-
-        assert world.name == "Test World"
-        assert world.description == "A test world"
-        assert world.characters == ["A", "B", "C"]
-        assert world.theme_name == "snek-classic"
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("name", "Test World"),
+            ("description", "A test world"),
+            ("characters", ("A", "B", "C")),
+            ("theme_name", "snek-classic"),
+        ],
+    )
+    def test_world_creation(self, sample_world, field, expected):
+        """Test creating a world stores each field."""
+        assert getattr(sample_world, field) == expected
 
 
 class TestWorldPath:
     """Test WorldPath class."""
 
-    def test_initialization(self):
+    def test_initialization(self, world_path):
         """Test world path initialization."""
-        journey = WorldPath()
+        assert len(world_path.worlds) > 0
+        assert world_path.worlds[0].name == "Basic Symbols"
+        assert world_path.worlds[0].theme_name == "snek-classic"
 
-        assert len(journey.worlds) > 0
-        assert journey.worlds[0].name == "Basic Symbols"
-        assert journey.worlds[0].theme_name == "snek-classic"
-
-    def test_world_theme_property(self):
+    def test_world_theme_property(self, world_path):
         """Test that world theme property works correctly."""
-        journey = WorldPath()
-
         # Test first world
-        world = journey.get_world(0)
+        world = world_path.get_world(0)
         assert world.theme_name in THEME_MAP
         assert world.theme == THEME_MAP[world.theme_name]
         assert world.theme.name == world.theme_name
 
         # Test another world
-        world2 = journey.get_world(1)
+        world2 = world_path.get_world(1)
         assert world2.theme_name in THEME_MAP
         assert world2.theme == THEME_MAP[world2.theme_name]
 
-    def test_get_food_character(self):
-        """Test getting food characters."""
-        journey = WorldPath()
-
-        # Get characters for world 0
-        chars_world_0 = set()
-        for _ in range(10):  # Get 10 characters
-            char = journey.get_food_character(0)
-            chars_world_0.add(char)
-            assert char in journey.worlds[0].characters
+    def test_food_character_in_world(self, first_world_chars, food_draws):
+        """Test drawn food characters belong to their world."""
+        assert set(food_draws) <= first_world_chars
 
+    def test_get_food_character(self, food_draws):
+        """Test getting food characters."""
         # Should have gotten multiple different characters
-        assert len(chars_world_0) > 1
+        assert len(set(food_draws)) > 1
 
-    def test_character_pool_refill(self):
+    def test_character_pool_refill(self, fresh_world_path, first_world_chars):
         """Test that character pool refills when exhausted."""
-        journey = WorldPath()
-        world = journey.worlds[0]
+        journey = fresh_world_path
+        pool_size = len(first_world_chars)
+
+        # Exhaust all characters, then draw more than are available
+        draws = [journey.get_food_character(0) for _ in range(pool_size + 5)]
+        counts = Counter(draws)
+        assert counts.keys() == first_world_chars
+        # Each character is drawn once per lap, so only the refill repeats any
+        assert set(counts.values()) == {1, 2}
+        assert sum(1 for count in counts.values() if count == 2) == 5
+
+        # Should have seen all characters before any repeat
+        assert set(draws[:pool_size]) == first_world_chars
 
-        # Exhaust all characters
-        chars_seen = []
-        for _ in range(len(world.characters) + 5):  # More than available
-            char = journey.get_food_character(0)
-            chars_seen.append(char)
-            assert char in world.characters
+    def test_seeded_food_characters(self):
+        """Test food characters are reproducible with a seeded generator."""
+        first = WorldPath(rng=random.Random(7))
+        second = WorldPath(rng=random.Random(7))
 
-        # Should have seen all characters
-        assert set(chars_seen[: len(world.characters)]) == set(world.characters)
+        draws = [first.get_food_character(0) for _ in range(15)]
+        assert draws == [second.get_food_character(0) for _ in range(15)]
 
-    def test_world_names_and_descriptions(self):
+    def test_world_names_and_descriptions(self, world_path):
         """Test getting world names and descriptions."""
-        journey = WorldPath()
-
-        assert journey.get_world_name(0) == "Basic Symbols"
-        assert "Simple geometric" in journey.get_world_description(0)
-
-        assert journey.get_world_name(1) == "Ancient Egypt"
-        assert "Hieroglyphic" in journey.get_world_description(1)
-
-    def test_world_progression_order(self):
-        """Test that worlds progress in the expected order."""
-        journey = WorldPath()
-
-        expected_order = [
-            "Basic Symbols",
-            "Ancient Egypt",
-            "Classical Greece",
-            "Norse Runes",
-            "Alchemical Mysteries",
-            "Mathematical Realm",
-            "Global Currencies",
-            "Digital Age",
-        ]
-
-        for i, expected_name in enumerate(expected_order):
-            assert journey.get_world_name(i) == expected_name
-
-    def test_world_wrap_around(self):
-        """Test that worlds wrap around after the last one."""
-        journey = WorldPath()
-
-        # Test wrap around - world 8 should go back to Basic Symbols
-        assert journey.get_world_name(8) == "Basic Symbols"
-        assert journey.get_world_name(9) == "Ancient Egypt"
+        assert world_path.get_world_name(0) == "Basic Symbols"
+        assert "Simple geometric" in world_path.get_world_description(0)
+
+        assert world_path.get_world_name(1) == "Ancient Egypt"
+        assert "Hieroglyphic" in world_path.get_world_description(1)
+
+    @pytest.mark.parametrize(
+        ("world_index", "world_name"),
+        [*enumerate(WORLD_ORDER), *WRAPPED_WORLD_NAMES],
+    )
+    def test_world_order(self, world_path, world_index, world_name):
+        """Test that worlds progress in the expected order and wrap around."""
+        assert world_path.get_world_name(world_index) == world_name
@@ -2,13 +2,9 @@
 
 from rich.cells import cell_len
 
-from snek.worlds import WorldPath
 
-
-def test_all_food_characters_single_width():
+def test_all_food_characters_single_width(world_path):
     """Ensure all food characters have single column width for safe grid rendering."""
-    world_path = WorldPath()
-
     # Collect all unique food characters from all worlds
     all_food_chars = set()
     for world in world_path.worlds:
@@ -28,9 +24,9 @@ def test_all_food_characters_single_width():
     )
 
 
-def test_food_character_per_level():
+def test_food_character_per_level(fresh_world_path):
     """Test that we can get a valid single-width food character for each level."""
-    world_path = WorldPath()
+    world_path = fresh_world_path
 
     # Test first 50 levels (should cover multiple worlds)
     for level in range(1, 51):